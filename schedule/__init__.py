@@ -40,14 +40,131 @@ Usage:
 from collections.abc import Hashable
 import datetime
 import functools
+import heapq
+import itertools
 import logging
+import operator
 import random
-import re
 import time
-from typing import Set, List, Optional, Callable, Union
+from typing import Set, List, Optional, Callable, Dict, Iterable, Tuple, Union
 
 logger = logging.getLogger("schedule")
 
+# Length of each time unit of a Job in seconds
+_UNIT_SECONDS = {
+    "seconds": 1,
+    "minutes": 60,
+    "hours": 60 * 60,
+    "days": 24 * 60 * 60,
+    "weeks": 7 * 24 * 60 * 60,
+}
+
+_WEEKDAYS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+_WEEKDAY_INDEX = {day: index for index, day in enumerate(_WEEKDAYS)}
+
+
+def _is_time_field(value: str, max_tens: str) -> bool:
+    """
+    Check that `value` is a two digit field of a time string passed to
+    Job.at() whose first digit is at most `max_tens`.
+    """
+    return len(value) == 2 and "0" <= value[0] <= max_tens and value[1].isdecimal()
+
+
+def _parse_iso(value: str, length: int) -> Optional[datetime.datetime]:
+    """
+    Parse an ISO 8601 date (`length` 10) or date and time separated by a
+    space (`length` 16 or 19) like strptime() would with the equivalent
+    format. Returns None if `value` is not shaped like that, as
+    fromisoformat() itself accepts more variants.
+    """
+    if (
+        len(value) == length
+        and value[4] == value[7] == "-"
+        and (length == 10 or value[10] == " ")
+        and value[13:14] in ("", ":")
+        and value[16:17] in ("", ":")
+    ):
+        return datetime.datetime.fromisoformat(value)
+    return None
+
+
+def _parse_clock(
+    value: str, count: int, with_hour: bool = True
+) -> Optional[datetime.datetime]:
+    """
+    Parse a time made of `count` colon separated two digit fields,
+    starting with the hour or, if `with_hour` is False, the minute, into
+    a datetime on the date used by strptime(). Returns None if `value` is
+    not shaped like that.
+    """
+    fields = value.split(":")
+    if len(fields) != count or not all(
+        len(field) == 2 and field.isascii() and field.isdigit() for field in fields
+    ):
+        return None
+    time_values = [int(field) for field in fields]
+    if not with_hour:
+        time_values.insert(0, 0)
+    hour, minute, second = (time_values + [0, 0])[:3]
+    return datetime.datetime(1900, 1, 1, hour, minute, second)
+
+
+# Parsers for common strptime() formats that avoid the generic strptime()
+# machinery. They return None for strings not shaped like their format and
+# raise ValueError for out of range values.
+_FAST_PARSERS: Dict[str, Callable[[str], Optional[datetime.datetime]]] = {
+    "%Y-%m-%d %H:%M:%S": functools.partial(_parse_iso, length=19),
+    "%Y-%m-%d %H:%M": functools.partial(_parse_iso, length=16),
+    "%Y-%m-%d": functools.partial(_parse_iso, length=10),
+    "%H:%M:%S": functools.partial(_parse_clock, count=3),
+    "%H:%M": functools.partial(_parse_clock, count=2),
+    "%M:%S": functools.partial(_parse_clock, count=2, with_hour=False),
+}
+
+# The numbers of ":" and "-" in any string strptime() accepts for the
+# formats above, as none of their fields can contain these characters.
+_SEPARATOR_COUNTS = {f: (f.count(":"), f.count("-")) for f in _FAST_PARSERS}
+
+
+@functools.lru_cache(maxsize=128)
+def _get_tz(name: str):
+    """
+    Return the pytz timezone with the given name. pytz is imported
+    lazily as it is only needed for jobs scheduled in a timezone.
+    """
+    import pytz
+
+    return pytz.timezone(name)
+
+
+# sort key ordering jobs by their next run without going through Job.__lt__
+_next_run_key = operator.attrgetter("next_run")
+
+# (next_run in seconds since _EPOCH, sequence number, job, next_run) entries
+# of the Scheduler run queue. The float keeps heap comparisons cheap.
+_QueueEntry = Tuple[float, int, "Job", datetime.datetime]
+
+# Naive epoch for the run queue keys. Unlike timestamp(), subtracting it
+# orders naive local datetimes by their wall clock time like comparing
+# them does, also around DST changes.
+_EPOCH = datetime.datetime(1970, 1, 1)
+
+
+def _naive_seconds(value: datetime.datetime) -> float:
+    """
+    Return the number of seconds from _EPOCH to the naive `value`.
+    """
+    return (value - _EPOCH).total_seconds()
+
 
 class ScheduleError(Exception):
     """Base schedule exception"""
@@ -80,14 +197,40 @@ class Scheduler:
     Objects instantiated by the :class:`Scheduler <Scheduler>` are
     factories to create jobs, keep record of scheduled jobs and
     handle their execution.
+
+    The scheduled jobs are listed in :attr:`jobs`. Treat that list as
+    read-only: jobs are added with :meth:`every` and :meth:`Job.do` and
+    removed with :meth:`cancel_job` or :meth:`clear`. Jobs appended to
+    or removed from the list directly are not picked up.
     """
 
+    __slots__ = (
+        "jobs",
+        "_job_order",
+        "_jobs_by_tag",
+        "_queue",
+        "_sequence",
+        "__weakref__",
+    )
+
     def __init__(self) -> None:
         self.jobs: List[Job] = []
+        # the jobs in self.jobs mapped to a number increasing in the order
+        # they were added, for constant time membership tests
+        self._job_order: Dict[Job, int] = {}
+        # scheduled jobs by the tags added with Job.tag()
+        self._jobs_by_tag: Dict[Hashable, Set[Job]] = {}
+
+        # Min-heap of the scheduled jobs ordered by next_run. Entries are
+        # not removed when a job is cancelled or rescheduled; an entry is
+        # only valid while it is the job's current ``_queue_entry``.
+        self._queue: List[_QueueEntry] = []
+        self._sequence = itertools.count()
 
     def run_pending(self) -> None:
         """
-        Run all jobs that are scheduled to run.
+        Run all jobs that are scheduled to run, in the order of their
+        next run.
 
         Please note that it is *intended behavior that run_pending()
         does not run missed jobs*. For example, if you've registered a job
@@ -95,9 +238,38 @@ class Scheduler:
         in one hour increments then your job won't be run 60 times in
         between but only once.
         """
-        runnable_jobs = (job for job in self.jobs if job.should_run)
-        for job in sorted(runnable_jobs):
-            self._run_job(job)
+        due = self._pop_due_entries(datetime.datetime.now())
+        try:
+            for entry in due:
+                job = entry[2]
+                if job._queue_entry is entry:
+                    self._run_job(job)
+        finally:
+            self._requeue_entries(due)
+
+    async def run_pending_async(self) -> None:
+        """
+        Run all jobs that are scheduled to run, awaiting the result of
+        jobs that return an awaitable (e.g. ``async def`` functions).
+
+        Must be awaited from a running event loop. The awaitables of all
+        due jobs are awaited concurrently. If jobs raise, the first
+        exception is re-raised once all due jobs have finished.
+        """
+        # asyncio is only imported when needed as it is slow to import
+        import asyncio
+
+        due = self._pop_due_entries(datetime.datetime.now())
+        try:
+            results = await asyncio.gather(
+                *[self._run_entry_async(entry) for entry in due],
+                return_exceptions=True,
+            )
+        finally:
+            self._requeue_entries(due)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
 
     def run_all(self, delay_seconds: int = 0) -> None:
         """
@@ -118,10 +290,31 @@ class Scheduler:
             self._run_job(job)
             time.sleep(delay_seconds)
 
+    async def run_all_async(self, delay_seconds: int = 0) -> None:
+        """
+        Run all jobs regardless if they are scheduled to run or not,
+        awaiting the result of jobs that return an awaitable.
+
+        Jobs run one after another; a delay of `delay` seconds is
+        awaited between each job.
+
+        :param delay_seconds: A delay added between every executed job
+        """
+        import asyncio
+
+        logger.debug(
+            "Running *all* %i jobs with %is delay in between",
+            len(self.jobs),
+            delay_seconds,
+        )
+        for job in self.jobs[:]:
+            await self._run_job_async(job)
+            await asyncio.sleep(delay_seconds)
+
     def get_jobs(self, tag: Optional[Hashable] = None) -> List["Job"]:
         """
         Gets scheduled jobs marked with the given tag, or all jobs
-        if tag is omitted.
+        if tag is omitted, in the order they were scheduled.
 
         :param tag: An identifier used to identify a subset of
                     jobs to retrieve
@@ -129,7 +322,9 @@ class Scheduler:
         if tag is None:
             return self.jobs[:]
         else:
-            return [job for job in self.jobs if tag in job.tags]
+            return sorted(
+                self._jobs_by_tag.get(tag, ()), key=self._job_order.__getitem__
+            )
 
     def clear(self, tag: Optional[Hashable] = None) -> None:
         """
@@ -141,10 +336,20 @@ class Scheduler:
         """
         if tag is None:
             logger.debug("Deleting *all* jobs")
+            for job in self.jobs:
+                job._queue_entry = None
             del self.jobs[:]
+            del self._queue[:]
+            self._job_order.clear()
+            self._jobs_by_tag.clear()
         else:
             logger.debug('Deleting all jobs tagged "%s"', tag)
-            self.jobs[:] = (job for job in self.jobs if tag not in job.tags)
+            for job in self._jobs_by_tag.get(tag, set()).copy():
+                job._queue_entry = None
+                del self._job_order[job]
+                self._unindex_tags(job)
+            self.jobs[:] = [job for job in self.jobs if job in self._job_order]
+            self._compact_queue()
 
     def cancel_job(self, job: "Job") -> None:
         """
@@ -152,11 +357,15 @@ class Scheduler:
 
         :param job: The job to be unscheduled
         """
-        try:
-            logger.debug('Cancelling job "%s"', str(job))
+        logger.debug('Cancelling job "%s"', job)
+        if isinstance(job, Job) and job in self._job_order:
+            del self._job_order[job]
             self.jobs.remove(job)
-        except ValueError:
-            logger.debug('Cancelling not-scheduled job "%s"', str(job))
+            self._unindex_tags(job)
+            job._queue_entry = None
+            self._compact_queue()
+        else:
+            logger.debug('Cancelling not-scheduled job "%s"', job)
 
     def every(self, interval: int = 1) -> "Job":
         """
@@ -168,9 +377,102 @@ class Scheduler:
         job = Job(interval, self)
         return job
 
+    def _add_job(self, job: "Job") -> None:
+        self.jobs.append(job)
+        self._job_order[job] = next(self._sequence)
+        self._index_tags(job, job.tags)
+        self._queue_job(job)
+
+    def _index_tags(self, job: "Job", tags: Iterable[Hashable]) -> None:
+        if job in self._job_order:
+            for tag in tags:
+                self._jobs_by_tag.setdefault(tag, set()).add(job)
+
+    def _unindex_tags(self, job: "Job") -> None:
+        for tag in job.tags:
+            tagged = self._jobs_by_tag.get(tag)
+            if tagged is not None:
+                tagged.discard(job)
+                if not tagged:
+                    del self._jobs_by_tag[tag]
+
+    def _queue_job(self, job: "Job") -> None:
+        next_run: datetime.datetime = job.next_run  # type: ignore
+        entry = (_naive_seconds(next_run), next(self._sequence), job, next_run)
+        job._queue_entry = entry
+        heapq.heappush(self._queue, entry)
+        self._compact_queue()
+
+    def _requeue_job(self, job: "Job") -> None:
+        # Called when the next_run of a job changes. Its previous entry
+        # becomes stale and is dropped once it reaches the queue head.
+        if job in self._job_order:
+            if job.next_run is None:
+                job._queue_entry = None
+            else:
+                self._queue_job(job)
+
+    def _pop_due_entries(self, now: datetime.datetime) -> List[_QueueEntry]:
+        """
+        Pop the entries of all jobs scheduled to run at or before `now`,
+        ordered by their next run.
+        """
+        now_seconds = _naive_seconds(now)
+        due = []
+        entry = self._next_entry()
+        while entry is not None and entry[0] <= now_seconds:
+            heapq.heappop(self._queue)
+            due.append(entry)
+            entry = self._next_entry()
+        return due
+
+    def _next_entry(self) -> Optional[_QueueEntry]:
+        """
+        Return the valid entry at the head of the run queue, or None if
+        no jobs are queued. Stale entries found at the head are dropped.
+        """
+        queue = self._queue
+        while queue:
+            entry = queue[0]
+            if entry[2]._queue_entry is not entry:
+                # the job was cancelled or rescheduled since
+                heapq.heappop(queue)
+            else:
+                return entry
+        return None
+
+    def _compact_queue(self) -> None:
+        # Entries of cancelled or rescheduled jobs deep in the heap are only
+        # dropped once they reach its head. Rebuild the heap when they make
+        # up most of it, so that its size stays proportional to the number
+        # of jobs. Called whenever an entry is added or a job removed.
+        queue = self._queue
+        if len(queue) > 2 * len(self._job_order):
+            queue[:] = [entry for entry in queue if entry[2]._queue_entry is entry]
+            heapq.heapify(queue)
+
+    def _requeue_entries(self, entries: List[_QueueEntry]) -> None:
+        # Jobs that did not run, e.g. because an earlier job raised, still
+        # own their entry and are put back to be retried on the next call.
+        for entry in entries:
+            if entry[2]._queue_entry is entry:
+                heapq.heappush(self._queue, entry)
+
     def _run_job(self, job: "Job") -> None:
-        ret = job.run()
-        if isinstance(ret, CancelJob) or ret is CancelJob:
+        self._reschedule_job(job, job.run())
+
+    async def _run_job_async(self, job: "Job") -> None:
+        self._reschedule_job(job, await job.run_async())
+
+    async def _run_entry_async(self, entry: _QueueEntry) -> None:
+        # the job may have been cancelled by a job that ran before
+        job = entry[2]
+        if job._queue_entry is entry:
+            await self._run_job_async(job)
+
+    def _reschedule_job(self, job: "Job", ret) -> None:
+        # Job.run() assigning next_run already requeued the job
+        if ret is CancelJob or isinstance(ret, CancelJob):
             self.cancel_job(job)
 
     def get_next_run(
@@ -184,12 +486,13 @@ class Scheduler:
         :return: A :class:`~datetime.datetime` object
                  or None if no jobs scheduled
         """
-        if not self.jobs:
-            return None
+        if tag is None:
+            entry = self._next_entry()
+            return None if entry is None else entry[3]
         jobs_filtered = self.get_jobs(tag)
         if not jobs_filtered:
             return None
-        return min(jobs_filtered).next_run
+        return min(jobs_filtered, key=_next_run_key).next_run
 
     next_run = property(get_next_run)
 
@@ -200,9 +503,28 @@ class Scheduler:
                  :meth:`next_run <Scheduler.next_run>`
                  or None if no jobs are scheduled
         """
-        if not self.next_run:
+        entry = self._next_entry()
+        if entry is None:
             return None
-        return (self.next_run - datetime.datetime.now()).total_seconds()
+        return (entry[3] - datetime.datetime.now()).total_seconds()
+
+
+def _weekday_property(day: str) -> property:
+    """
+    Build the Job property that makes a weekly job run on the given day.
+    """
+
+    def fget(job: "Job") -> "Job":
+        if job.interval != 1:
+            raise IntervalError(
+                "Scheduling .{0}() jobs is only allowed for weekly jobs. "
+                "Using .{0}() on a job scheduled to run every 2 or more weeks "
+                "is not supported.".format(day)
+            )
+        job.start_day = day
+        return job.weeks
+
+    return property(fget)
 
 
 class Job:
@@ -223,10 +545,34 @@ class Job:
     method, which also defines its `interval`.
     """
 
+    __slots__ = (
+        "interval",
+        "latest",
+        "_job_func",
+        "_job_func_name",
+        "_job_args",
+        "_job_kwargs",
+        "unit",
+        "at_time",
+        "at_time_zone",
+        "last_run",
+        "_next_run",
+        "period",
+        "start_day",
+        "cancel_after",
+        "tags",
+        "scheduler",
+        "_queue_entry",
+        "__weakref__",
+    )
+
     def __init__(self, interval: int, scheduler: Optional[Scheduler] = None):
         self.interval: int = interval  # pause interval * unit between runs
         self.latest: Optional[int] = None  # upper limit to the interval
-        self.job_func: Optional[functools.partial] = None  # the job job_func to run
+        self._job_func: Optional[Callable] = None  # the job_func to run
+        self._job_func_name: str = repr(None)  # name of job_func used in logs
+        self._job_args: tuple = ()  # positional arguments passed on to job_func
+        self._job_kwargs: dict = {}  # keyword arguments passed on to job_func
 
         # time units, e.g. 'minutes', 'hours', ...
         self.unit: Optional[str] = None
@@ -240,8 +586,8 @@ class Job:
         # datetime of the last run
         self.last_run: Optional[datetime.datetime] = None
 
-        # datetime of the next run
-        self.next_run: Optional[datetime.datetime] = None
+        # datetime of the next run, see the next_run property
+        self._next_run: Optional[datetime.datetime] = None
 
         # timedelta between runs, only valid for
         self.period: Optional[datetime.timedelta] = None
@@ -252,9 +598,13 @@ class Job:
         # optional time of final run
         self.cancel_after: Optional[datetime.datetime] = None
 
-        self.tags: Set[Hashable] = set()  # unique set of tags for the job
+        # unique set of tags for the job, read-only (see tag())
+        self.tags: Set[Hashable] = set()
         self.scheduler: Optional[Scheduler] = scheduler  # scheduler to register with
 
+        # entry of this job in the run queue of its scheduler
+        self._queue_entry: Optional[_QueueEntry] = None
+
     def __lt__(self, other) -> bool:
         """
         PeriodicJobs are sortable based on the scheduled time they
@@ -263,17 +613,12 @@ class Job:
         return self.next_run < other.next_run
 
     def __str__(self) -> str:
-        if hasattr(self.job_func, "__name__"):
-            job_func_name = self.job_func.__name__  # type: ignore
-        else:
-            job_func_name = repr(self.job_func)
-
         return ("Job(interval={}, unit={}, do={}, args={}, kwargs={})").format(
             self.interval,
             self.unit,
-            job_func_name,
-            "()" if self.job_func is None else self.job_func.args,
-            "{}" if self.job_func is None else self.job_func.keywords,
+            self._job_func_name,
+            self._job_args,
+            self._job_kwargs,
         )
 
     def __repr__(self):
@@ -288,15 +633,10 @@ class Job:
             format_time(self.next_run),
         )
 
-        if hasattr(self.job_func, "__name__"):
-            job_func_name = self.job_func.__name__
-        else:
-            job_func_name = repr(self.job_func)
-
-        if self.job_func is not None:
-            args = [repr(x) if is_repr(x) else str(x) for x in self.job_func.args]
-            kwargs = ["%s=%s" % (k, repr(v)) for k, v in self.job_func.keywords.items()]
-            call_repr = job_func_name + "(" + ", ".join(args + kwargs) + ")"
+        if self._job_func is not None:
+            args = [repr(x) if is_repr(x) else str(x) for x in self._job_args]
+            kwargs = ["%s=%s" % (k, repr(v)) for k, v in self._job_kwargs.items()]
+            call_repr = self._job_func_name + "(" + ", ".join(args + kwargs) + ")"
         else:
             call_repr = "[None]"
 
@@ -323,6 +663,33 @@ class Job:
                 timestats=timestats,
             )
 
+    @property
+    def next_run(self) -> Optional[datetime.datetime]:
+        """
+        The local datetime when the job runs next. Setting it moves the
+        job to that time in the run queue of its scheduler.
+        """
+        return self._next_run
+
+    @next_run.setter
+    def next_run(self, value: Optional[datetime.datetime]) -> None:
+        self._next_run = value
+        if self.scheduler is not None:
+            self.scheduler._requeue_job(self)
+
+    @property
+    def job_func(self) -> Optional[functools.partial]:
+        """
+        The function scheduled with :meth:`do` bound to its arguments.
+        """
+        if self._job_func is None:
+            return None
+        job_func = functools.partial(
+            self._job_func, *self._job_args, **self._job_kwargs
+        )
+        functools.update_wrapper(job_func, self._job_func)
+        return job_func
+
     @property
     def second(self):
         if self.interval != 1:
@@ -378,88 +745,22 @@ class Job:
         self.unit = "weeks"
         return self
 
-    @property
-    def monday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .monday() jobs is only allowed for weekly jobs. "
-                "Using .monday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "monday"
-        return self.weeks
-
-    @property
-    def tuesday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .tuesday() jobs is only allowed for weekly jobs. "
-                "Using .tuesday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "tuesday"
-        return self.weeks
-
-    @property
-    def wednesday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .wednesday() jobs is only allowed for weekly jobs. "
-                "Using .wednesday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "wednesday"
-        return self.weeks
-
-    @property
-    def thursday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .thursday() jobs is only allowed for weekly jobs. "
-                "Using .thursday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "thursday"
-        return self.weeks
-
-    @property
-    def friday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .friday() jobs is only allowed for weekly jobs. "
-                "Using .friday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "friday"
-        return self.weeks
-
-    @property
-    def saturday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .saturday() jobs is only allowed for weekly jobs. "
-                "Using .saturday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "saturday"
-        return self.weeks
-
-    @property
-    def sunday(self):
-        if self.interval != 1:
-            raise IntervalError(
-                "Scheduling .sunday() jobs is only allowed for weekly jobs. "
-                "Using .sunday() on a job scheduled to run every 2 or more weeks "
-                "is not supported."
-            )
-        self.start_day = "sunday"
-        return self.weeks
+    monday = _weekday_property("monday")
+    tuesday = _weekday_property("tuesday")
+    wednesday = _weekday_property("wednesday")
+    thursday = _weekday_property("thursday")
+    friday = _weekday_property("friday")
+    saturday = _weekday_property("saturday")
+    sunday = _weekday_property("sunday")
 
     def tag(self, *tags: Hashable):
         """
         Tags the job with one or more unique identifiers.
 
         Tags must be hashable. Duplicate tags are discarded.
+        Add tags with this method only: tags added to :attr:`tags`
+        directly are not seen by :meth:`Scheduler.get_jobs` and
+        :meth:`Scheduler.clear`.
 
         :param tags: A unique list of ``Hashable`` tags.
         :return: The invoked job instance
@@ -467,6 +768,8 @@ class Job:
         if not all(isinstance(tag, Hashable) for tag in tags):
             raise TypeError("Tags must be hashable")
         self.tags.update(tags)
+        if self.scheduler is not None:
+            self.scheduler._index_tags(self, tags)
         return self
 
     def at(self, time_str: str, tz: Optional[str] = None):
@@ -497,36 +800,49 @@ class Job:
             )
 
         if tz is not None:
-            import pytz
-
             if isinstance(tz, str):
-                self.at_time_zone = pytz.timezone(tz)  # type: ignore
-            elif isinstance(tz, pytz.BaseTzInfo):
-                self.at_time_zone = tz
+                self.at_time_zone = _get_tz(tz)
             else:
-                raise ScheduleValueError(
-                    "Timezone must be string or pytz.timezone object"
-                )
+                import pytz
+
+                if isinstance(tz, pytz.BaseTzInfo):
+                    self.at_time_zone = tz
+                else:
+                    raise ScheduleValueError(
+                        "Timezone must be string or pytz.timezone object"
+                    )
 
         if not isinstance(time_str, str):
             raise TypeError("at() should be passed a string")
+        time_values = time_str.split(":")
         if self.unit == "days" or self.start_day:
-            if not re.match(r"^[0-2]\d:[0-5]\d(:[0-5]\d)?$", time_str):
+            if not (
+                len(time_values) in (2, 3)
+                and _is_time_field(time_values[0], "2")
+                and all(_is_time_field(value, "5") for value in time_values[1:])
+            ):
                 raise ScheduleValueError(
                     "Invalid time format for a daily job (valid format is HH:MM(:SS)?)"
                 )
         if self.unit == "hours":
-            if not re.match(r"^([0-5]\d)?:[0-5]\d$", time_str):
+            if not (
+                len(time_values) == 2
+                and (not time_values[0] or _is_time_field(time_values[0], "5"))
+                and _is_time_field(time_values[1], "5")
+            ):
                 raise ScheduleValueError(
                     "Invalid time format for an hourly job (valid format is (MM)?:SS)"
                 )
 
         if self.unit == "minutes":
-            if not re.match(r"^:[0-5]\d$", time_str):
+            if not (
+                len(time_values) == 2
+                and not time_values[0]
+                and _is_time_field(time_values[1], "5")
+            ):
                 raise ScheduleValueError(
                     "Invalid time format for a minutely job (valid format is :SS)"
                 )
-        time_values = time_str.split(":")
         hour: Union[str, int]
         minute: Union[str, int]
         second: Union[str, int]
@@ -653,15 +969,20 @@ class Job:
         :param job_func: The function to be scheduled
         :return: The invoked job instance
         """
-        self.job_func = functools.partial(job_func, *args, **kwargs)
-        functools.update_wrapper(self.job_func, job_func)
+        self._job_func = job_func
+        self._job_args = args
+        self._job_kwargs = kwargs
+        if hasattr(job_func, "__name__"):
+            self._job_func_name = job_func.__name__
+        else:
+            self._job_func_name = repr(self.job_func)
         self._schedule_next_run()
         if self.scheduler is None:
             raise ScheduleError(
                 "Unable to a add job to schedule. "
                 "Job is not associated with an scheduler"
             )
-        self.scheduler.jobs.append(self)
+        self.scheduler._add_job(self)
         return self
 
     @property
@@ -684,25 +1005,50 @@ class Job:
                  deadline is reached.
 
         """
-        if self._is_overdue(datetime.datetime.now()):
+        if self.cancel_after is not None and self._is_overdue(datetime.datetime.now()):
             logger.debug("Cancelling job %s", self)
             return CancelJob
 
         logger.debug("Running job %s", self)
-        ret = self.job_func()
+        ret = self._job_func(*self._job_args, **self._job_kwargs)  # type: ignore
+        return self._finish_run(ret)
+
+    async def run_async(self):
+        """
+        Run the job like :meth:`run`, awaiting the value returned by
+        the `job_func` before rescheduling if it is awaitable.
+
+        :return: The (awaited) return value returned by the `job_func`,
+                 or CancelJob if the job's deadline is reached.
+        """
+        import inspect
+
+        if self.cancel_after is not None and self._is_overdue(datetime.datetime.now()):
+            logger.debug("Cancelling job %s", self)
+            return CancelJob
+
+        logger.debug("Running job %s", self)
+        ret = self._job_func(*self._job_args, **self._job_kwargs)  # type: ignore
+        if inspect.isawaitable(ret):
+            ret = await ret
+        return self._finish_run(ret)
+
+    def _finish_run(self, ret):
         self.last_run = datetime.datetime.now()
-        self._schedule_next_run()
+        self._schedule_next_run(self.last_run)
 
-        if self._is_overdue(self.next_run):
+        if self.cancel_after is not None and self._is_overdue(self.next_run):
             logger.debug("Cancelling job %s", self)
             return CancelJob
         return ret
 
-    def _schedule_next_run(self) -> None:
+    def _schedule_next_run(self, now: Optional[datetime.datetime] = None) -> None:
         """
         Compute the instant when this job should run next.
+
+        :param now: The current local time. Defaults to datetime.now()
         """
-        if self.unit not in ("seconds", "minutes", "hours", "days", "weeks"):
+        if self.unit not in _UNIT_SECONDS:
             raise ScheduleValueError(
                 "Invalid unit (valid units are `seconds`, `minutes`, `hours`, "
                 "`days`, and `weeks`)"
@@ -716,39 +1062,40 @@ class Job:
             interval = self.interval
 
         # Do all computation in the context of the requested timezone
-        if self.at_time_zone is not None:
-            now = datetime.datetime.now(self.at_time_zone)
-        else:
+        if now is None:
             now = datetime.datetime.now()
+        local_now = now
+        if self.at_time_zone is not None:
+            now = now.astimezone(self.at_time_zone)
+
+        self.period = datetime.timedelta(seconds=interval * _UNIT_SECONDS[self.unit])
+        next_run = now + self.period
+        if (
+            self.start_day is None
+            and self.at_time is None
+            and self.at_time_zone is None
+        ):
+            # Plain interval job, none of the adjustments below apply
+            self.next_run = next_run
+            return
 
-        self.period = datetime.timedelta(**{self.unit: interval})
-        self.next_run = now + self.period
         if self.start_day is not None:
             if self.unit != "weeks":
                 raise ScheduleValueError("`unit` should be 'weeks'")
-            weekdays = (
-                "monday",
-                "tuesday",
-                "wednesday",
-                "thursday",
-                "friday",
-                "saturday",
-                "sunday",
-            )
-            if self.start_day not in weekdays:
+            weekday = _WEEKDAY_INDEX.get(self.start_day)
+            if weekday is None:
                 raise ScheduleValueError(
-                    "Invalid start day (valid start days are {})".format(weekdays)
+                    "Invalid start day (valid start days are {})".format(_WEEKDAYS)
                 )
-            weekday = weekdays.index(self.start_day)
-            days_ahead = weekday - self.next_run.weekday()
+            days_ahead = weekday - next_run.weekday()
             if days_ahead <= 0:  # Target day already happened this week
                 days_ahead += 7
-            self.next_run += datetime.timedelta(days_ahead) - self.period
+            next_run += datetime.timedelta(days_ahead) - self.period
 
         # before we apply the .at() time, we need to normalize the timestamp
         # to ensure we change the time elements in the new timezone
         if self.at_time_zone is not None:
-            self.next_run = self.at_time_zone.normalize(self.next_run)
+            next_run = self.at_time_zone.normalize(next_run)
 
         if self.at_time is not None:
             if self.unit not in ("days", "hours", "minutes") and self.start_day is None:
@@ -759,19 +1106,23 @@ class Job:
             if self.unit in ["days", "hours"] or self.start_day is not None:
                 kwargs["minute"] = self.at_time.minute
 
-            self.next_run = self.next_run.replace(**kwargs)  # type: ignore
+            next_run = next_run.replace(**kwargs)  # type: ignore
 
             # Make sure we run at the specified time *today* (or *this hour*)
             # as well. This accounts for when a job takes so long it finished
             # in the next period.
-            last_run_tz = self._to_at_timezone(self.last_run)
-            if not last_run_tz or (self.next_run - last_run_tz) > self.period:
+            # run() passes last_run as `now`, which is already converted
+            if self.last_run is local_now:
+                last_run_tz: Optional[datetime.datetime] = now
+            else:
+                last_run_tz = self._to_at_timezone(self.last_run)
+            if not last_run_tz or (next_run - last_run_tz) > self.period:
                 if (
                     self.unit == "days"
-                    and self.next_run.time() > now.time()
+                    and next_run.time() > now.time()
                     and self.interval == 1
                 ):
-                    self.next_run = self.next_run - datetime.timedelta(days=1)
+                    next_run = next_run - datetime.timedelta(days=1)
                 elif self.unit == "hours" and (
                     self.at_time.minute > now.minute
                     or (
@@ -779,19 +1130,20 @@ class Job:
                         and self.at_time.second > now.second
                     )
                 ):
-                    self.next_run = self.next_run - datetime.timedelta(hours=1)
+                    next_run = next_run - datetime.timedelta(hours=1)
                 elif self.unit == "minutes" and self.at_time.second > now.second:
-                    self.next_run = self.next_run - datetime.timedelta(minutes=1)
+                    next_run = next_run - datetime.timedelta(minutes=1)
         if self.start_day is not None and self.at_time is not None:
             # Let's see if we will still make that time we specified today
-            if (self.next_run - now).days >= 7:
-                self.next_run -= self.period
+            if (next_run - now).days >= 7:
+                next_run -= self.period
 
         # Calculations happen in the configured timezone, but to execute the schedule we
         # need to know the next_run time in the system time. So we convert back to naive local
         if self.at_time_zone is not None:
-            self.next_run = self._normalize_preserve_timestamp(self.next_run)
-            self.next_run = self.next_run.astimezone().replace(tzinfo=None)
+            next_run = self._normalize_preserve_timestamp(next_run)
+            next_run = next_run.astimezone().replace(tzinfo=None)
+        self.next_run = next_run
 
     # Usually when normalization of a timestamp causes the timestamp to change,
     # it preserves the moment in time and changes the local timestamp.
@@ -799,15 +1151,17 @@ class Job:
     def _normalize_preserve_timestamp(
         self, input: datetime.datetime
     ) -> datetime.datetime:
-        if self.at_time_zone is None or input is None:
-            return input
-        normalized = self.at_time_zone.normalize(input)
-        return normalized.replace(
-            day=input.day,
-            hour=input.hour,
-            minute=input.minute,
-            second=input.second,
-            microsecond=input.microsecond,
+        # only called for jobs with an at_time_zone, see _schedule_next_run()
+        normalized = self.at_time_zone.normalize(input)  # type: ignore
+        return datetime.datetime(
+            normalized.year,
+            normalized.month,
+            input.day,
+            input.hour,
+            input.minute,
+            input.second,
+            input.microsecond,
+            normalized.tzinfo,
         )
 
     def _to_at_timezone(
@@ -823,7 +1177,22 @@ class Job:
     def _decode_datetimestr(
         self, datetime_str: str, formats: List[str]
     ) -> Optional[datetime.datetime]:
+        # Try the fast parsers of all formats first, they return None
+        # instead of raising for strings of another shape. strptime() only
+        # handles what none of them accepts, e.g. single digit fields.
+        for f in formats:
+            fast_parse = _FAST_PARSERS.get(f)
+            if fast_parse is not None:
+                try:
+                    parsed = fast_parse(datetime_str)
+                except ValueError:
+                    continue
+                if parsed is not None:
+                    return parsed
+        separators = (datetime_str.count(":"), datetime_str.count("-"))
         for f in formats:
+            if _SEPARATOR_COUNTS.get(f, separators) != separators:
+                continue
             try:
                 return datetime.datetime.strptime(datetime_str, f)
             except ValueError:
@@ -837,57 +1206,20 @@ class Job:
 #: Default :class:`Scheduler <Scheduler>` object
 default_scheduler = Scheduler()
 
-#: Default :class:`Jobs <Job>` list
+#: Default :class:`Jobs <Job>` list, read-only (see :class:`Scheduler`)
 jobs = default_scheduler.jobs  # todo: should this be a copy, e.g. jobs()?
 
-
-def every(interval: int = 1) -> Job:
-    """Calls :meth:`every <Scheduler.every>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    return default_scheduler.every(interval)
-
-
-def run_pending() -> None:
-    """Calls :meth:`run_pending <Scheduler.run_pending>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    default_scheduler.run_pending()
-
-
-def run_all(delay_seconds: int = 0) -> None:
-    """Calls :meth:`run_all <Scheduler.run_all>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    default_scheduler.run_all(delay_seconds=delay_seconds)
-
-
-def get_jobs(tag: Optional[Hashable] = None) -> List[Job]:
-    """Calls :meth:`get_jobs <Scheduler.get_jobs>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    return default_scheduler.get_jobs(tag)
-
-
-def clear(tag: Optional[Hashable] = None) -> None:
-    """Calls :meth:`clear <Scheduler.clear>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    default_scheduler.clear(tag)
-
-
-def cancel_job(job: Job) -> None:
-    """Calls :meth:`cancel_job <Scheduler.cancel_job>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    default_scheduler.cancel_job(job)
-
-
-def next_run(tag: Optional[Hashable] = None) -> Optional[datetime.datetime]:
-    """Calls :meth:`next_run <Scheduler.next_run>` on the
-    :data:`default scheduler instance <default_scheduler>`.
-    """
-    return default_scheduler.get_next_run(tag)
+# Bound methods of the default scheduler rather than wrapper functions,
+# so calling a shortcut costs no extra function call.
+every = default_scheduler.every
+run_pending = default_scheduler.run_pending
+run_pending_async = default_scheduler.run_pending_async
+run_all = default_scheduler.run_all
+run_all_async = default_scheduler.run_all_async
+get_jobs = default_scheduler.get_jobs
+clear = default_scheduler.clear
+cancel_job = default_scheduler.cancel_job
+next_run = default_scheduler.get_next_run
 
 
 def idle_seconds() -> Optional[float]:
@@ -906,9 +1238,9 @@ def repeat(job, *args, **kwargs):
 
     :param job: a :class:`Jobs <Job>`
     """
+    return functools.partial(_schedule_decorated, job, args, kwargs)
 
-    def _schedule_decorator(decorated_function):
-        job.do(decorated_function, *args, **kwargs)
-        return decorated_function
 
-    return _schedule_decorator
+def _schedule_decorated(job, args, kwargs, decorated_function):
+    job.do(decorated_function, *args, **kwargs)
+    return decorated_function
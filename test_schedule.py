@@ -1,4 +1,5 @@
 """Unit tests for schedule.py"""
+import asyncio
 import datetime
 import functools
 import mock
@@ -40,7 +41,7 @@ class mock_datetime:
     Monkey-patch datetime for predictable results
     """
 
-    def __init__(self, year, month, day, hour, minute, second=0, zone=None):
+    def __init__(self, year, month, day, hour, minute, second=0, zone=None, fold=0):
         self.year = year
         self.month = month
         self.day = day
@@ -48,6 +49,7 @@ class mock_datetime:
         self.minute = minute
         self.second = second
         self.zone = zone
+        self.fold = fold
         self.original_datetime = None
         self.original_zone = None
 
@@ -66,6 +68,7 @@ class mock_datetime:
                     self.hour,
                     self.minute,
                     self.second,
+                    fold=self.fold,
                 )
                 if tz:
                     return mock_date.astimezone(tz)
@@ -80,7 +83,13 @@ class mock_datetime:
             time.tzset()
 
         return MockDate(
-            self.year, self.month, self.day, self.hour, self.minute, self.second
+            self.year,
+            self.month,
+            self.day,
+            self.hour,
+            self.minute,
+            self.second,
+            fold=self.fold,
         )
 
     def __exit__(self, *args, **kwargs):
@@ -331,6 +340,9 @@ class SchedulerTests(unittest.TestCase):
             assert every().day.until("10:30:50").do(mock_job).cancel_after == m.replace(
                 hour=10, minute=30, second=50, microsecond=0
             )
+            assert every().day.until("3000-01-01").do(
+                mock_job
+            ).cancel_after == datetime.datetime(3000, 1, 1)
             assert every().day.until("3000-01-01 10:30").do(
                 mock_job
             ).cancel_after == datetime.datetime(3000, 1, 1, 10, 30, 0)
@@ -345,6 +357,10 @@ class SchedulerTests(unittest.TestCase):
         self.assertRaises(TypeError, every().day.until, 123)
         self.assertRaises(ScheduleValueError, every().day.until, "123")
         self.assertRaises(ScheduleValueError, every().day.until, "01-01-3000")
+        self.assertRaises(ScheduleValueError, every().day.until, "3000-01-01T10:30")
+        self.assertRaises(
+            ScheduleValueError, every().day.until, "3000-01-01 10:30+01:00"
+        )
 
         # Using .until() with moments in the passed
         self.assertRaises(
@@ -885,6 +901,17 @@ class SchedulerTests(unittest.TestCase):
         schedule.run_all()
         mock_job.assert_called_once_with(1, 2, "three", foo=23, bar={})
 
+    def test_job_func_property(self):
+        mock_job = make_mock_job("job_fun")
+        assert every().second.job_func is None
+
+        job = every().second.do(mock_job, 1, foo=23)
+        assert job.job_func.__name__ == "job_fun"
+        assert job.job_func.args == (1,)
+        assert job.job_func.keywords == {"foo": 23}
+        job.job_func()
+        mock_job.assert_called_once_with(1, foo=23)
+
     def test_to_string(self):
         def job_fun():
             pass
@@ -987,6 +1014,155 @@ class SchedulerTests(unittest.TestCase):
             schedule.run_pending()
             assert mock_job.call_count == 4
 
+    def test_run_pending_order(self):
+        calls = []
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every().hour.do(calls.append, "hourly")
+        with mock_datetime(2010, 1, 6, 12, 45):
+            every().minute.do(calls.append, "minutely")
+        with mock_datetime(2010, 1, 6, 12, 30):
+            every(20).minutes.do(calls.append, "twenty minutes")
+
+        with mock_datetime(2010, 1, 6, 13, 30):
+            schedule.run_pending()
+            assert calls == ["minutely", "twenty minutes", "hourly"]
+
+    def test_run_pending_next_run_changed(self):
+        mock_job = make_mock_job()
+        original_datetime = datetime.datetime
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            job = every().minute.do(mock_job)
+        job.next_run = original_datetime(2010, 1, 6, 12, 30)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            schedule.run_pending()
+            assert mock_job.call_count == 0
+
+        with mock_datetime(2010, 1, 6, 12, 31):
+            schedule.run_pending()
+            assert mock_job.call_count == 1
+            assert job.next_run == original_datetime(2010, 1, 6, 12, 32)
+
+    def test_run_pending_next_run_moved_earlier(self):
+        minutely_job = make_mock_job("minutely")
+        hourly_job = make_mock_job("hourly")
+        original_datetime = datetime.datetime
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every(10).minutes.do(minutely_job)
+            job = every().hour.do(hourly_job)
+        job.next_run = original_datetime(2010, 1, 6, 12, 16)
+
+        with mock_datetime(2010, 1, 6, 12, 17):
+            schedule.run_pending()
+            assert minutely_job.call_count == 0
+            assert hourly_job.call_count == 1
+            assert job.next_run == original_datetime(2010, 1, 6, 13, 17)
+
+    def test_run_pending_job_raises(self):
+        failing_job = make_mock_job("failing")
+        failing_job.side_effect = ValueError("failing")
+        mock_job = make_mock_job()
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every().minute.do(failing_job)
+            every().minute.do(mock_job)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            self.assertRaises(ValueError, schedule.run_pending)
+            assert failing_job.call_count == 1
+            assert mock_job.call_count == 0
+
+        # Both jobs are still scheduled and retried on the next call
+        failing_job.side_effect = None
+        with mock_datetime(2010, 1, 6, 12, 16, 30):
+            schedule.run_pending()
+            assert failing_job.call_count == 2
+            assert mock_job.call_count == 1
+
+    def test_run_pending_skips_job_cancelled_by_earlier_job(self):
+        mock_job = make_mock_job()
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every().minute.do(lambda: schedule.cancel_job(cancelled))
+            cancelled = every().minute.do(mock_job)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            schedule.run_pending()
+            assert mock_job.call_count == 0
+            assert len(schedule.jobs) == 1
+
+    def test_run_pending_async(self):
+        calls = []
+
+        async def async_job(name):
+            await asyncio.sleep(0)
+            calls.append(name)
+
+        mock_job = make_mock_job()
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every().minute.do(async_job, "minutely")
+            every().hour.do(async_job, "hourly")
+            every().minute.do(mock_job)
+            asyncio.run(schedule.run_pending_async())
+            assert calls == []
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            asyncio.run(schedule.run_pending_async())
+            assert calls == ["minutely"]
+            assert mock_job.call_count == 1
+
+        with mock_datetime(2010, 1, 6, 13, 16):
+            asyncio.run(schedule.run_pending_async())
+            assert sorted(calls) == ["hourly", "minutely", "minutely"]
+            assert mock_job.call_count == 2
+
+    def test_run_pending_async_cancel_job(self):
+        async def stop_job():
+            return schedule.CancelJob
+
+        async def failing_job():
+            raise ValueError("failing")
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every().minute.do(stop_job)
+            every().minute.do(failing_job)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            with self.assertRaises(ValueError):
+                asyncio.run(schedule.default_scheduler.run_pending_async())
+            assert len(schedule.jobs) == 1
+
+    def test_run_pending_async_skips_job_cancelled_by_earlier_job(self):
+        async def canceller():
+            schedule.cancel_job(cancelled)
+
+        mock_job = make_mock_job()
+
+        with mock_datetime(2010, 1, 6, 12, 15):
+            every().minute.do(canceller)
+            cancelled = every().minute.do(mock_job)
+
+        with mock_datetime(2010, 1, 6, 12, 16):
+            asyncio.run(schedule.run_pending_async())
+            assert mock_job.call_count == 0
+            assert len(schedule.jobs) == 1
+
+    def test_run_all_async(self):
+        async def stop_job():
+            return schedule.CancelJob
+
+        mock_job = make_mock_job()
+        every().second.do(stop_job)
+        every().second.do(mock_job)
+
+        asyncio.run(schedule.run_all_async())
+        assert mock_job.call_count == 1
+        assert len(schedule.jobs) == 1
+
     def test_run_every_weekday_at_specific_time_today(self):
         mock_job = make_mock_job()
         with mock_datetime(2010, 1, 6, 13, 16):
@@ -1051,6 +1227,22 @@ class SchedulerTests(unittest.TestCase):
             # Make sure the hourly job is first
             assert schedule.next_run() == original_datetime(2010, 1, 6, 14, 16)
 
+    def test_next_run_after_cancel_and_run(self):
+        with mock_datetime(2010, 1, 6, 13, 16):
+            minutely_job = every().minute.do(make_mock_job("minutely"))
+            hourly_job = every().hour.do(make_mock_job("hourly"))
+            assert schedule.next_run() == minutely_job.next_run
+
+            schedule.cancel_job(minutely_job)
+            assert schedule.next_run() == hourly_job.next_run
+
+        with mock_datetime(2010, 1, 6, 14, 16):
+            half_hourly_job = every(30).minutes.do(make_mock_job("half-hourly"))
+            schedule.run_pending()
+            assert hourly_job.last_run is not None
+            assert schedule.next_run() == half_hourly_job.next_run
+            assert schedule.idle_seconds() == 60 * 30
+
     def test_idle_seconds(self):
         assert schedule.default_scheduler.next_run is None
         assert schedule.idle_seconds() is None
@@ -1063,6 +1255,47 @@ class SchedulerTests(unittest.TestCase):
             assert schedule.next_run() is None
             assert schedule.idle_seconds() is None
 
+    def test_run_pending_repeated_hour(self):
+        mock_job = make_mock_job()
+        # second 02:30 of the hour repeated when DST ends in Berlin
+        with mock_datetime(2024, 10, 27, 2, 30, zone=TZ_BERLIN, fold=1):
+            every().minute.do(mock_job)
+        for second in range(5):
+            with mock_datetime(2024, 10, 27, 2, 30, second, TZ_BERLIN, fold=1):
+                schedule.run_pending()
+        assert mock_job.call_count == 0
+
+        with mock_datetime(2024, 10, 27, 2, 31, zone=TZ_BERLIN, fold=1):
+            schedule.run_pending()
+        assert mock_job.call_count == 1
+
+    def test_run_pending_skipped_hour(self):
+        mock_job = make_mock_job()
+        with mock_datetime(2024, 3, 31, 1, 30, zone=TZ_BERLIN):
+            every().hour.do(mock_job)
+        # 02:30 does not exist when DST starts in Berlin, 03:00 follows 02:00
+        with mock_datetime(2024, 3, 31, 3, 0, zone=TZ_BERLIN):
+            schedule.run_pending()
+        assert mock_job.call_count == 1
+
+    def test_idle_seconds_repeated_hour(self):
+        mock_job = make_mock_job()
+        # second 02:30 of the hour repeated when DST ends in Berlin
+        with mock_datetime(2024, 10, 27, 2, 30, zone=TZ_BERLIN, fold=1):
+            every().minute.do(mock_job)
+            assert schedule.idle_seconds() == 60
+
+    def test_next_run_moved_earlier(self):
+        mock_job = make_mock_job()
+        original_datetime = datetime.datetime
+        with mock_datetime(2020, 12, 9, 21, 46):
+            every(10).minutes.do(mock_job)
+            job = every().hour.do(mock_job).tag("hourly")
+            job.next_run = original_datetime(2020, 12, 9, 21, 50)
+            assert schedule.next_run() == job.next_run
+            assert schedule.next_run("hourly") == job.next_run
+            assert schedule.idle_seconds() == 60 * 4
+
     def test_cancel_job(self):
         def stop_job():
             return schedule.CancelJob
@@ -1085,6 +1318,41 @@ class SchedulerTests(unittest.TestCase):
         schedule.cancel_job(mj)
         assert len(schedule.jobs) == 0
 
+    def test_cancel_job_of_other_scheduler(self):
+        mock_job = make_mock_job()
+        scheduler = schedule.Scheduler()
+        job = scheduler.every().second.do(mock_job)
+        every().second.do(mock_job)
+
+        schedule.cancel_job(job)
+        assert len(schedule.jobs) == 1
+        assert scheduler.jobs == [job]
+
+        scheduler.run_all()
+        assert mock_job.call_count == 1
+
+    def test_cancel_many_jobs(self):
+        mock_job = make_mock_job()
+        scheduler = schedule.Scheduler()
+        with mock_datetime(2010, 1, 6, 12, 0):
+            jobs = [scheduler.every(i).seconds.do(mock_job) for i in range(1, 101)]
+        for job in jobs[1:91]:
+            scheduler.cancel_job(job)
+        assert len(scheduler.jobs) == 10
+        # entries of cancelled jobs do not pile up in the run queue
+        assert len(scheduler._queue) <= 20
+        assert scheduler.next_run == datetime.datetime(2010, 1, 6, 12, 0, 1)
+
+        with mock_datetime(2010, 1, 6, 12, 1, 40):
+            scheduler.run_pending()
+        assert mock_job.call_count == 10
+
+        # neither do the entries of jobs rescheduled by run_all()
+        for _ in range(100):
+            scheduler.run_all()
+        assert mock_job.call_count == 1010
+        assert len(scheduler._queue) <= 20
+
     def test_cancel_jobs(self):
         def stop_job():
             return schedule.CancelJob
@@ -1132,6 +1400,33 @@ class SchedulerTests(unittest.TestCase):
         schedule.clear()
         assert len(schedule.jobs) == 0
 
+    def test_get_by_tag_after_changes(self):
+        job1 = every().second.tag("tag1").do(make_mock_job(name="job1"))
+        job2 = every().second.do(make_mock_job(name="job2")).tag("tag1")
+        job3 = every().second.do(make_mock_job(name="job3"))
+        assert schedule.get_jobs("tag1") == [job1, job2]
+        assert schedule.get_jobs("tag2") == []
+
+        job3.tag("tag1", "tag2")
+        assert schedule.get_jobs("tag1") == [job1, job2, job3]
+        assert schedule.get_jobs("tag2") == [job3]
+
+        schedule.cancel_job(job2)
+        assert schedule.get_jobs("tag1") == [job1, job3]
+        schedule.clear("tag2")
+        assert schedule.get_jobs("tag1") == [job1]
+        assert schedule.jobs == [job1]
+
+        # Tagging a cancelled job does not make it show up again
+        job2.tag("tag2")
+        assert schedule.get_jobs("tag2") == []
+
+    def test_get_by_tag_in_scheduling_order(self):
+        job1 = every().second.do(make_mock_job(name="job1"))
+        job2 = every().second.do(make_mock_job(name="job2")).tag("tag1")
+        job1.tag("tag1")
+        assert schedule.get_jobs("tag1") == [job1, job2]
+
     def test_clear_by_tag(self):
         every().second.do(make_mock_job(name="job1")).tag("tag1")
         every().second.do(make_mock_job(name="job2")).tag("tag1", "tag2")